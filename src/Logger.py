@@ -9,15 +9,49 @@ import os, time
 LOG_FILENAME = "energenie.csv"
 HEADINGS = 'timestamp,mfrid,prodid,sensorid,flags,switch,voltage,freq,reactive,real,apparent,current,temperature'
 
+# Dispatch table for the params we log, built once at import time.
+# Maps paramid -> (CSV column name, flag position), so capturing a record
+# is a single dict lookup instead of a chain of comparisons.
+PARAM_DISPATCH = {
+    OpenThings.PARAM_SWITCH_STATE:   ('switch',      0),
+    OpenThings.PARAM_DOOR_SENSOR:    ('switch',      0),
+    OpenThings.PARAM_VOLTAGE:        ('voltage',     1),
+    OpenThings.PARAM_FREQUENCY:      ('freq',        2),
+    OpenThings.PARAM_REACTIVE_POWER: ('reactive',    3),
+    OpenThings.PARAM_REAL_POWER:     ('real',        4),
+    OpenThings.PARAM_APPARENT_POWER: ('apparent',    5),
+    OpenThings.PARAM_CURRENT:        ('current',     6),
+    OpenThings.PARAM_TEMPERATURE:    ('temperature', 7),
+}
+
+# Defaults for any data that doesn't appear in a message,
+# copied per message rather than rebuilt key by key
+CSV_DEFAULTS = {
+    "switch":      None,
+    "voltage":     None,
+    "freq":        None,
+    "reactive":    None,
+    "real":        None,
+    "apparent":    None,
+    "current":     None,
+    "temperature": None
+}
+
+
+# How many lines to write between explicit flushes.
+# The default of 1 flushes every line, so 'tail -f' keeps working.
+# Raise this if you are logging bursts of messages and the flush cost matters.
+FLUSH_EVERY = 1
 
 log_file = None
+unflushed_lines = 0
 
 def trace(msg):
     print(str(msg))
 
 
 def logMessage(msg):
-    global log_file
+    global log_file, unflushed_lines
 
     if log_file == None:
         if not os.path.isfile(LOG_FILENAME):
@@ -28,65 +62,39 @@ def logMessage(msg):
 
     # get the header
     header    = msg['header']
-    timestamp = time.time()
+    try:
+        timestamp = msg['rxtimestamp'] # stamped when the radio received it
+    except KeyError:
+        timestamp = time.time() # not stamped, so stamp it now
     mfrid     = header['mfrid']
     productid = header['productid']
     sensorid  = header['sensorid']
 
     # set defaults for any data that doesn't appear in this message
-    # but build flags so we know which ones this contains
-    flags = [0 for i in range(8)]
-    switch = None
-    voltage = None
-    freq = None
-    reactive = None
-    real = None
-    apparent = None
-    current = None
-    temperature = None
+    # but build flags so we know which ones this contains.
+    # flags is a bitmask, bit n set means CSV flag column n contains data
+    flags = 0
+    values = CSV_DEFAULTS.copy()
 
     # capture any data that we want
     ##trace(msg)
     for rec in msg['recs']:
-        paramid = rec['paramid']
-        try:
-            value = rec['value']
-        except:
-            value = None
-
-        if   paramid == OpenThings.PARAM_SWITCH_STATE:
-            switch = value
-            flags[0] = 1
-        elif paramid == OpenThings.PARAM_DOOR_SENSOR:
-            switch = value
-            flags[0] = 1
-        elif paramid == OpenThings.PARAM_VOLTAGE:
-            flags[1] = 1
-            voltage = value
-        elif paramid == OpenThings.PARAM_FREQUENCY:
-            flags[2] = 1
-            freq = value
-        elif paramid == OpenThings.PARAM_REACTIVE_POWER:
-            flags[3] = 1
-            reactive = value
-        elif paramid == OpenThings.PARAM_REAL_POWER:
-            flags[4] = 1
-            real = value
-        elif paramid == OpenThings.PARAM_APPARENT_POWER:
-            flags[5] = 1
-            apparent = value
-        elif paramid == OpenThings.PARAM_CURRENT:
-            flags[6] = 1
-            current = value
-        elif paramid == OpenThings.PARAM_TEMPERATURE:
-            flags[7] = 1
-            temperature = value
-
-    # generate a line of CSV
-    flags = "".join([str(a) for a in flags])
-    csv = "%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s" % (timestamp, mfrid, productid, sensorid, flags, switch, voltage, freq, reactive, real, apparent, current, temperature)
+        slot = PARAM_DISPATCH.get(rec['paramid'])
+        if slot != None:
+            name, flagbit = slot
+            values[name] = rec.get('value') # None if not present
+            flags |= (1 << flagbit)
+
+    # generate a line of CSV, rendering the bitmask as eight digits, bit 0 first
+    flags = "".join([str((flags >> i) & 1) for i in range(8)])
+    csv = "%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s" % (timestamp, mfrid, productid, sensorid, flags,
+        values["switch"], values["voltage"], values["freq"], values["reactive"],
+        values["real"], values["apparent"], values["current"], values["temperature"])
     log_file.write(csv + '\n')
-    log_file.flush()
+    unflushed_lines += 1
+    if unflushed_lines >= FLUSH_EVERY:
+        log_file.flush()
+        unflushed_lines = 0
     ##trace(csv) # testing
 
 # END
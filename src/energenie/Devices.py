@@ -469,6 +469,25 @@ class MiHomeDevice(EnergenieDevice):
     ##def handle_message(self, payload):
     #override for any specific handling
 
+    def fill_readings(self, payload):
+        """Fill self.readings from a message, using the param_map table.
+        Sub classes define self.param_map in their __init__ as a dict of
+        paramid -> Readings field name, and call this from handle_message."""
+        for rec in payload["recs"]:
+            paramid = rec["paramid"]
+            if "value" in rec:
+                field = self.param_map.get(paramid)
+                if field != None:
+                    value = self.convert_reading(paramid, rec["value"])
+                    setattr(self.readings, field, value)
+                else:
+                    param_name = OpenThings.paramid_to_paramname(paramid)
+                    print("unwanted paramid: %s" % param_name)
+
+    def convert_reading(self, paramid, value): # -> value
+        """Hook for sub classes to adjust a reading value before it is stored"""
+        return value
+
     def send_message(self, payload):
         #TODO: interface with air_interface
         #is payload a pydict with header at this point, and we have to call OpenThings.encode?
@@ -498,6 +517,17 @@ class OOKSwitch(LegacyDevice):
         self.radio_config.inner_times = 8
         self.capabilities.switch = True
         self.capabilities.receive = True
+        # The device_id never changes, so build the two payloads just once
+        self.on_payload = {
+            "house_address":  self.device_id[0],
+            "device_index":   self.device_id[1],
+            "on":             True
+        }
+        self.off_payload = {
+            "house_address":  self.device_id[0],
+            "device_index":   self.device_id[1],
+            "on":             False
+        }
 
     def __repr__(self):
         return "OOKSwitch(%s,%s)" % (str(hex(self.device_id[0])), str(hex(self.device_id[1])))
@@ -507,23 +537,13 @@ class OOKSwitch(LegacyDevice):
         #TODO: should this be here, or in LegacyDevice??
         #addressing should probably be in LegacyDevice
         #child devices might interpret the command differently
-        payload = {
-            "house_address":  self.device_id[0],
-            "device_index":   self.device_id[1],
-            "on":             True
-        }
-        self.send_message(payload)
+        self.send_message(self.on_payload)
 
     def turn_off(self):
         #TODO: should this be here, or in LegacyDevice???
         #addressing should probably be in LegacyDevice
         #child devices might interpret the command differently
-        payload = {
-            "house_address":  self.device_id[0],
-            "device_index":   self.device_id[1],
-            "on":             False
-        }
-        self.send_message(payload)
+        self.send_message(self.off_payload)
 
     def set_switch(self, state):
         if state:
@@ -559,6 +579,17 @@ class MiHomeLight(LegacyDevice):
         self.radio_config.inner_times = 75
         self.capabilities.switch = True
         self.capabilities.receive = True
+        # The device_id never changes, so build the two payloads just once
+        self.on_payload = {
+            "house_address":  self.device_id[0],
+            "device_index":   self.device_id[1],
+            "on":             True
+        }
+        self.off_payload = {
+            "house_address":  self.device_id[0],
+            "device_index":   self.device_id[1],
+            "on":             False
+        }
 
     def __repr__(self):
         return "MiHomeLight(%s,%s)" % (str(hex(self.device_id[0])), str(hex(self.device_id[1])))
@@ -567,23 +598,13 @@ class MiHomeLight(LegacyDevice):
         #TODO: should this be here, or in LegacyDevice??
         #addressing should probably be in LegacyDevice
         #child devices might interpret the command differently
-        payload = {
-            "house_address":  self.device_id[0],
-            "device_index":   self.device_id[1],
-            "on":             True
-        }
-        self.send_message(payload)
+        self.send_message(self.on_payload)
 
     def turn_off(self):
         #TODO: should this be here, or in LegacyDevice???
         #addressing should probably be in LegacyDevice
         #child devices might interpret the command differently
-        payload = {
-            "house_address":  self.device_id[0],
-            "device_index":   self.device_id[1],
-            "on":             False
-        }
-        self.send_message(payload)
+        self.send_message(self.off_payload)
 
     def set_switch(self, state):
         if state:
@@ -628,6 +649,15 @@ class MIHO004(MiHomeDevice):
             reactive_power = None
             real_power     = None
         self.readings = Readings()
+        # paramid -> Readings field name, used by handle_message
+        self.param_map = {
+            OpenThings.PARAM_VOLTAGE:        "voltage",
+            OpenThings.PARAM_CURRENT:        "current",
+            OpenThings.PARAM_REAL_POWER:     "real_power",
+            OpenThings.PARAM_APPARENT_POWER: "apparent_power",
+            OpenThings.PARAM_REACTIVE_POWER: "reactive_power",
+            OpenThings.PARAM_FREQUENCY:      "frequency"
+        }
         self.radio_config.inner_times = 4
         self.capabilities.send = True
         self.capabilities.switch = True
@@ -641,30 +671,8 @@ class MIHO004(MiHomeDevice):
         return MiHomeDevice.get_join_req(MFRID_ENERGENIE, PRODUCTID_MIHO004, deviceid)
 
     def handle_message(self, payload):
-        ##print("MIHO005 new data %s %s" % (self.device_id, payload))
-        for rec in payload["recs"]:
-            paramid = rec["paramid"]
-            #TODO: consider making this table driven and allowing our base class to fill our readings in for us
-            #  then just define the mapping table in __init__ (i.e. paramid->Readings field name)
-            value = rec["value"]
-            if paramid == OpenThings.PARAM_VOLTAGE:
-                self.readings.voltage = value
-            elif paramid == OpenThings.PARAM_CURRENT:
-                self.readings.current = value
-            elif paramid == OpenThings.PARAM_REAL_POWER:
-                self.readings.real_power = value
-            elif paramid == OpenThings.PARAM_APPARENT_POWER:
-                self.readings.apparent_power = value
-            elif paramid == OpenThings.PARAM_REACTIVE_POWER:
-                self.readings.reactive_power = value
-            elif paramid == OpenThings.PARAM_FREQUENCY:
-                self.readings.frequency = value
-            else:
-                try:
-                    param_name = OpenThings.param_info[paramid]['n'] # name
-                except:
-                    param_name = "UNKNOWN_%s" % str(hex(paramid))
-                print("unwanted paramid: %s" % param_name)
+        ##print("MIHO004 new data %s %s" % (self.device_id, payload))
+        self.fill_readings(payload)
 
     def get_readings(self): # -> readings:pydict
         """A way to get all readings as a single consistent set"""
@@ -717,6 +725,16 @@ class MIHO005(MiHomeDevice):
             reactive_power = None
             real_power     = None
         self.readings = Readings()
+        # paramid -> Readings field name, used by handle_message
+        self.param_map = {
+            OpenThings.PARAM_SWITCH_STATE:   "switch",
+            OpenThings.PARAM_VOLTAGE:        "voltage",
+            OpenThings.PARAM_CURRENT:        "current",
+            OpenThings.PARAM_REAL_POWER:     "real_power",
+            OpenThings.PARAM_APPARENT_POWER: "apparent_power",
+            OpenThings.PARAM_REACTIVE_POWER: "reactive_power",
+            OpenThings.PARAM_FREQUENCY:      "frequency"
+        }
         self.radio_config.inner_times = 4
         self.capabilities.send = True
         self.capabilities.receive = True
@@ -732,31 +750,12 @@ class MIHO005(MiHomeDevice):
 
     def handle_message(self, payload):
         ##print("MIHO005 new data %s %s" % (self.device_id, payload))
-        for rec in payload["recs"]:
-            paramid = rec["paramid"]
-            #TODO: consider making this table driven and allowing our base class to fill our readings in for us
-            #  then just define the mapping table in __init__ (i.e. paramid->Readings field name)
-            value = rec["value"]
-            if paramid == OpenThings.PARAM_SWITCH_STATE:
-                self.readings.switch = ((value == True) or (value != 0))
-            elif paramid == OpenThings.PARAM_VOLTAGE:
-                self.readings.voltage = value
-            elif paramid == OpenThings.PARAM_CURRENT:
-                self.readings.current = value
-            elif paramid == OpenThings.PARAM_REAL_POWER:
-                self.readings.real_power = value
-            elif paramid == OpenThings.PARAM_APPARENT_POWER:
-                self.readings.apparent_power = value
-            elif paramid == OpenThings.PARAM_REACTIVE_POWER:
-                self.readings.reactive_power = value
-            elif paramid == OpenThings.PARAM_FREQUENCY:
-                self.readings.frequency = value
-            else:
-                try:
-                    param_name = OpenThings.param_info[paramid]['n'] # name
-                except:
-                    param_name = "UNKNOWN_%s" % str(hex(paramid))
-                print("unwanted paramid: %s" % param_name)
+        self.fill_readings(payload)
+
+    def convert_reading(self, paramid, value):
+        if paramid == OpenThings.PARAM_SWITCH_STATE:
+            return ((value == True) or (value != 0))
+        return value
 
     def get_readings(self): # -> readings:pydict
         """A way to get all readings as a single consistent set"""
@@ -848,34 +847,19 @@ class MIHO006(MiHomeDevice):
             current         = None
             apparent_power  = None
         self.readings = Readings()
+        # paramid -> Readings field name, used by handle_message
+        self.param_map = {
+            OpenThings.PARAM_VOLTAGE:        "battery_voltage",
+            OpenThings.PARAM_CURRENT:        "current",
+            OpenThings.PARAM_APPARENT_POWER: "apparent_power"
+        }
         self.capabilities.send = True
 
     def __repr__(self):
         return "MIHO006(%s)" % str(hex(self.device_id))
 
     def handle_message(self, payload):
-        for rec in payload["recs"]:
-            paramid = rec["paramid"]
-            #TODO: consider making this table driven and allowing our base class to fill our readings in for us
-            #TODO: consider using @OpenThings.parameter as a decorator to the receive function
-            #it will then register a handler for that message for itself as a handler
-            #we still need Readings() defined too as a cache. The decorator could add
-            #an entry into the cache too for us perhaps?
-            if "value" in rec:
-                value = rec["value"]
-                if paramid == OpenThings.PARAM_VOLTAGE:
-                    self.readings.battery_voltage = value
-                elif paramid == OpenThings.PARAM_CURRENT:
-                    self.readings.current = value
-                elif paramid == OpenThings.PARAM_APPARENT_POWER:
-                    self.readings.apparent_power = value
-                else:
-                    try:
-                        param_name = OpenThings.param_info[paramid]['n'] # name
-                    except:
-                        param_name = "UNKNOWN_%s" % str(hex(paramid))
-                    print("unwanted paramid: %s" % param_name)
-        pass
+        self.fill_readings(payload)
 
     def get_battery_voltage(self): # -> voltage:float
         return self.readings.battery_voltage
@@ -959,6 +943,11 @@ class MIHO032(MiHomeDevice):
             switch_state = None
             battery_alarm = None
         self.readings = Readings()
+        # paramid -> Readings field name, used by handle_message
+        self.param_map = {
+            OpenThings.PARAM_MOTION_DETECTOR: "switch_state",
+            OpenThings.PARAM_ALARM:           "battery_alarm"
+        }
         self.capabilities.send = True
 
     def __repr__(self):
@@ -966,28 +955,18 @@ class MIHO032(MiHomeDevice):
 
     def handle_message(self, payload):
         ##print("MIHO032 new data %s %s" % (self.device_id, payload))
-        for rec in payload["recs"]:
-            paramid = rec["paramid"]
-            #TODO: consider making this table driven and allowing our base class to fill our readings in for us
-            #TODO: consider using @OpenThings.parameter as a decorator to the receive function
-            #it will then register a handler for that message for itself as a handler
-            #we still need Readings() defined too as a cache. The decorator could add
-            #an entry into the cache too for us perhaps?
-            if "value" in rec:
-                value = rec["value"]
-                if paramid == OpenThings.PARAM_MOTION_DETECTOR:
-                    self.readings.switch_state = ((value == True) or (value != 0))
-                elif paramid == OpenThings.PARAM_ALARM:
-                    if value == 0x42: # battery alarming
-                        self.readings.battery_alarm = True
-                    elif value == 0x62: # battery not alarming
-                        self.readings.battery_alarm = False
-                else:
-                    try:
-                        param_name = OpenThings.param_info[paramid]['n'] # name
-                    except:
-                        param_name = "UNKNOWN_%s" % str(hex(paramid))
-                    print("unwanted paramid: %s" % param_name)
+        self.fill_readings(payload)
+
+    def convert_reading(self, paramid, value):
+        if paramid == OpenThings.PARAM_MOTION_DETECTOR:
+            return ((value == True) or (value != 0))
+        if paramid == OpenThings.PARAM_ALARM:
+            if value == 0x42: # battery alarming
+                return True
+            elif value == 0x62: # battery not alarming
+                return False
+            return self.readings.battery_alarm # unrecognised code, keep last state
+        return value
 
     def get_switch_state(self): # -> switch:bool
         return self.readings.switch_state
@@ -1005,6 +984,10 @@ class MIHO033(MiHomeDevice):
         class Readings():
             switch_state = None
         self.readings = Readings()
+        # paramid -> Readings field name, used by handle_message
+        self.param_map = {
+            OpenThings.PARAM_DOOR_SENSOR: "switch_state"
+        }
         self.capabilities.send = True
 
     def __repr__(self):
@@ -1012,23 +995,12 @@ class MIHO033(MiHomeDevice):
 
     def handle_message(self, payload):
         ##print("MIHO033 new data %s %s" % (self.device_id, payload))
-        for rec in payload["recs"]:
-            paramid = rec["paramid"]
-            #TODO: consider making this table driven and allowing our base class to fill our readings in for us
-            #TODO: consider using @OpenThings.parameter as a decorator to the receive function
-            #it will then register a handler for that message for itself as a handler
-            #we still need Readings() defined too as a cache. The decorator could add
-            #an entry into the cache too for us perhaps?
-            if "value" in rec:
-                value = rec["value"]
-                if paramid == OpenThings.PARAM_DOOR_SENSOR:
-                    self.readings.switch_state = ((value == True) or (value != 0))
-                else:
-                    try:
-                        param_name = OpenThings.param_info[paramid]['n'] # name
-                    except:
-                        param_name = "UNKNOWN_%s" % str(hex(paramid))
-                    print("unwanted paramid: %s" % param_name)
+        self.fill_readings(payload)
+
+    def convert_reading(self, paramid, value):
+        if paramid == OpenThings.PARAM_DOOR_SENSOR:
+            return ((value == True) or (value != 0))
+        return value
 
     def get_switch_state(self): # -> switch:bool
         return self.readings.switch_state
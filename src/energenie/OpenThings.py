@@ -138,13 +138,19 @@ param_info = {
 }
 
 
+# Reverse lookup of param_info, name -> paramid, built once at import time
+# so that name lookups are a single dict access rather than a linear scan
+param_ids = {}
+for _paramid in param_info:
+	param_ids[param_info[_paramid]['n']] = _paramid
+
+
 def paramname_to_paramid(paramname):
 	"""Turn a parameter name to a parameter id number"""
-	for paramid in param_info:
-		name = param_info[paramid]['n'] # name
-		if name == paramname:
-			return paramid
-	raise ValueError("Unknown param name %s" % paramname)
+	try:
+		return param_ids[paramname]
+	except KeyError:
+		raise ValueError("Unknown param name %s" % paramname)
 
 
 def paramid_to_paramname(paramid):
@@ -221,9 +227,10 @@ def decode(payload, decrypt=True, receive_timestamp=None):
 		param = payload[i]
 		wr = ((param & 0x80) == 0x80)
 		paramid = param & 0x7F
-		if paramid in param_info:
-			paramname = (param_info[paramid])["n"] # name
-			paramunit = (param_info[paramid])["u"] # unit
+		info = param_info.get(paramid) # look up the entry just once
+		if info != None:
+			paramname = info["n"] # name
+			paramunit = info["u"] # unit
 		else:
 			paramname = "UNKNOWN_" + hex(paramid)
 			paramunit = "UNKNOWN_UNIT"
@@ -681,7 +688,6 @@ class Message():
 
 	def copyof(self): # -> Message
 		"""Clone, to create a new message that is a completely independent copy"""
-		import copy
 		return Message(copy.deepcopy(self.pydict))
 
 	def set(self, **kwargs):
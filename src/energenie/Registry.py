@@ -65,9 +65,11 @@ class DeviceRegistry(): # this is actions, so is this the 'RegistRAR'??
         if self.fsk_router != None:
             if c.can_send(): # if can transmit, we can receive from it
                 if isinstance(c, Devices.MiHomeDevice):
-                    print("Adding rx route for transmit enabled device %s" % c)
                     address = (c.manufacturer_id, c.product_id, c.device_id)
-                    self.fsk_router.add(address, c)
+                    if not self.fsk_router.has_route(address):
+                        # only route on first get(), re-adding is redundant work
+                        print("Adding rx route for transmit enabled device %s" % c)
+                        self.fsk_router.add(address, c)
         return c
 
     def rename(self, old_name, new_name):
@@ -184,6 +186,10 @@ class Router():
         # address might be a string, a number, a tuple, but probably always the same for any one router
         self.routes[address] = instance
 
+    def has_route(self, address): # -> boolean
+        """Is this address already in the routing table?"""
+        return address in self.routes
+
     def list(self):
         print("ROUTES:")
         for address in self.routes:
@@ -81,6 +81,12 @@ def encode_test_message(pattern): #-> list of numbers
     return payload
 
 
+# Cache of previously encoded switch messages.
+# The encoding is deterministic and apps switch the same few devices over
+# and over, so the bit-pattern is built once per (state, device, house).
+encoded_switch_messages = {}
+
+
 def encode_switch_message(state, device_address=ALL_SOCKETS, house_address=None): # -> list of numbers
     """Build a message to turn a switch on or off"""
     ##print("build: state:%s, device:%d, house:%s" % (str(state), device_address, str(house_address)))
@@ -88,6 +94,10 @@ def encode_switch_message(state, device_address=ALL_SOCKETS, house_address=None)
     if house_address == None:
         house_address = DEFAULT_ADDR
 
+    key = (bool(state), device_address, house_address)
+    if key in encoded_switch_messages:
+        return encoded_switch_messages[key]
+
     payload = [] + PREAMBLE
     payload += encode_bits((house_address & 0x0F0000) >> 16, 4)
     payload += encode_bits((house_address & 0x00FF00) >> 8,  8)
@@ -131,6 +141,7 @@ def encode_switch_message(state, device_address=ALL_SOCKETS, house_address=None)
         
     payload += encode_bits(bits, 4)
     ##print("encoded as:%s" % ashex(payload))
+    encoded_switch_messages[key] = payload
     return payload
 
 
@@ -62,6 +62,9 @@ def init():
     ##discovery_askjoin(ask)
 
 
+POLL_DELAY = 0.01 # seconds between radio polls when nothing is waiting
+
+
 def loop(receive_time=1):
     """Handle receive processing"""
     radio.receiver(fsk=True)
@@ -69,6 +72,8 @@ def loop(receive_time=1):
     handled = False
 
     while True:
+        # one clock read per spin, shared by the receive timestamp
+        # and the timeout check below
         if radio.is_receive_waiting():
             payload = radio.receive_cbp()
             now = time.time()
@@ -84,8 +89,12 @@ def loop(receive_time=1):
                 handled = True
             except OpenThings.OpenThingsException:
                 print("Can't decode payload:%s" % payload)
+        else:
+            # nothing waiting, don't spin the CPU at 100% while we wait.
+            # The radio FIFO buffers anything that arrives during the nap.
+            time.sleep(POLL_DELAY)
+            now = time.time()
 
-        now = time.time()
         if now > timeout: break
 
     return handled
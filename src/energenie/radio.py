@@ -64,6 +64,21 @@ def tohex(l):
     return line
 
 
+# ctypes array types keyed by frame length.
+# Creating a ctypes array type is surprisingly expensive, and frame lengths
+# repeat constantly, so build each type once and reuse it.
+frame_types = {}
+
+def frame_type(framelen):
+    """Get the ctypes byte array type for this frame length"""
+    try:
+        return frame_types[framelen]
+    except KeyError:
+        t = ctypes.c_ubyte * framelen
+        frame_types[framelen] = t
+        return t
+
+
 def init():
     """Initialise the module ready for use"""
     #extern void radio_init(void);
@@ -125,11 +140,11 @@ def transmit(payload, outer_times=1, inner_times=8, outer_delay=0):
     if inner_times < 1 or inner_times > 255:
         raise ValueError("tx times must be 0..255")
 
-    framelen     = len(payload)
-    Frame        = ctypes.c_ubyte * framelen
+    Frame        = frame_type(framelen)
     txframe      = Frame(*payload)
     inner_times  = ctypes.c_ubyte(inner_times)
-    
+
+
     for i in range(outer_times):
         #TODO: transmit() will mode change if required
         #this means that outer_times will keep popping and pushing the mode
@@ -152,7 +167,7 @@ def send_payload(payload, outer_times=1, inner_times=8, outer_delay=0):
         raise ValueError("outer_times must be >0")
     if inner_times < 1 or inner_times > 255:
         raise ValueError("tx times must be 0..255")
-    Frame          = ctypes.c_ubyte * framelen
+    Frame          = frame_type(framelen)
     txframe        = Frame(*payload)
     inner_times    = ctypes.c_ubyte(inner_times)
 
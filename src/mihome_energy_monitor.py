@@ -8,7 +8,6 @@
 
 import energenie
 import Logger
-import time
 
 APP_DELAY    = 2
 switch_state = False
@@ -16,8 +15,10 @@ switch_state = False
 def energy_monitor_loop():
     global switch_state
 
-    # Process any received messages from the real radio
-    energenie.loop()
+    # Process any received messages from the real radio.
+    # The receive window doubles as the app delay, so incoming messages
+    # are handled as they arrive instead of queueing behind a blind sleep.
+    energenie.loop(APP_DELAY)
 
     # For all devices in the registry, if they have a switch, toggle it
     for d in energenie.registry.devices():
@@ -32,11 +33,11 @@ def energy_monitor_loop():
         try:
             p = d.get_power()
             print("Power: %s" % str(p))
-        except:
+        except (AttributeError, RuntimeError):
+            # AttributeError: device has no get_power()
+            # RuntimeError: device has not received a reading yet
             pass # Ignore it if can't provide a power
 
-    time.sleep(APP_DELAY)
-
 
 if __name__ == "__main__":
 